@@ -3,10 +3,18 @@ ImpactBridge - Crisis Coordination Platform
 Simple SQLite-based application for managing crisis cases and volunteers
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash, abort
 import sqlite3
 import os
-from datetime import datetime
+import json
+import queue
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from validators import INT_FIELD_RULES
 
 # Initialize Flask application
 app = Flask(__name__)
@@ -15,23 +23,210 @@ app.config['SECRET_KEY'] = 'your-secret-key-here-change-in-production'
 # Database configuration
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'impactbridge.db')
 
+# Sample data loaded by seed_database()
+SEED_DATA_PATH = os.path.join(os.path.dirname(__file__), 'seed.json')
+
+# Number of SQLite connections kept open per process
+DATABASE_POOL_SIZE = 8
+
+# Seconds the dashboard statistics are cached between queries
+DASHBOARD_CACHE_TTL = 30
+
+# Number of cases shown per page on /cases
+CASES_PER_PAGE = 50
+
+# Highest /cases page accepted; a larger page's OFFSET overflows SQLite's
+# 64-bit integers (every page past the last one is empty anyway)
+MAX_CASES_PAGE = (2 ** 63 - 1) // CASES_PER_PAGE
+
+# Characters of each description loaded for the /cases listing
+CASE_SUMMARY_LENGTH = 200
+
 
 # ============================================================================
 # DATABASE SETUP AND CONNECTION
 # ============================================================================
 
-def get_db_connection():
+# Process-local pool of open connections, filled on first use so that
+# forked workers never share a connection opened by their parent.
+_POOL = queue.Queue(maxsize=DATABASE_POOL_SIZE)
+_pool_lock = threading.Lock()
+_pool_filled = False
+
+# Numeric fields of the crisis report form, in priority-formula order
+_CASE_NUMERIC_FIELDS = ('severity', 'people_affected', 'urgency', 'available_resources')
+
+# SQLite 3.31+ computes priority_score itself as a STORED generated column;
+# older versions fall back to calculating it in Python on insert.
+GENERATED_PRIORITY = sqlite3.sqlite_version_info >= (3, 31, 0)
+
+# The priority formula over the input columns, shared by the generated column
+# and the dashboard aggregate
+_PRIORITY_SQL = '(severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)'
+
+if GENERATED_PRIORITY:
+    _PRIORITY_COLUMN_SQL = f'priority_score INTEGER GENERATED ALWAYS AS ({_PRIORITY_SQL}) STORED'
+else:
+    _PRIORITY_COLUMN_SQL = 'priority_score INTEGER NOT NULL'
+
+_CREATE_CASES_SQL = f'''
+    CREATE TABLE IF NOT EXISTS cases (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        severity INTEGER NOT NULL CHECK(severity >= 1 AND severity <= 5),
+        people_affected INTEGER NOT NULL CHECK(people_affected >= 0),
+        urgency INTEGER NOT NULL CHECK(urgency >= 1 AND urgency <= 5),
+        available_resources INTEGER NOT NULL CHECK(available_resources >= 0),
+        required_skill TEXT NOT NULL,
+        {_PRIORITY_COLUMN_SQL},
+        status TEXT NOT NULL DEFAULT 'Pending',
+        created_at INTEGER NOT NULL
+    )
+'''
+
+_CREATE_VOLUNTEERS_SQL = '''
+    CREATE TABLE IF NOT EXISTS volunteers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        skills TEXT NOT NULL,
+        availability INTEGER NOT NULL DEFAULT 1,
+        registered_at INTEGER NOT NULL
+    )
+'''
+
+# Converts an ISO-8601 text timestamp written by older versions into epoch
+# nanoseconds (millisecond precision is all strftime exposes)
+_ISO_TO_EPOCH_NS_SQL = (
+    "CAST(strftime('%s', {0}) AS INTEGER) * 1000000000"
+    " + CAST(substr(strftime('%f', {0}), 4) AS INTEGER) * 1000000"
+)
+
+# Full schema, applied by init_database() as a single script
+_SCHEMA_SQL = f'''
+    -- Write-ahead logging: readers and the writer no longer block each other
+    PRAGMA journal_mode=WAL;
+    
+    {_CREATE_CASES_SQL};
+    
+    {_CREATE_VOLUNTEERS_SQL};
+    
+    -- /cases ordering: walks the index instead of sorting the table
+    CREATE INDEX IF NOT EXISTS idx_priority_created
+    ON cases(priority_score DESC, created_at DESC);
+    
+    -- Dashboard aggregates: covers status and the priority formula inputs.
+    -- SQLite will not read a generated column from an index, so an index
+    -- on priority_score could not cover the aggregate.
+    CREATE INDEX IF NOT EXISTS idx_status_priority_inputs
+    ON cases(status, severity, people_affected, urgency, available_resources);
+    
+    -- Superseded by the composite indexes above
+    DROP INDEX IF EXISTS idx_priority_score;
+    DROP INDEX IF EXISTS idx_status;
+    DROP INDEX IF EXISTS idx_status_priority;
+    
+    -- Full-text index over volunteer skills, kept in sync by triggers
+    CREATE VIRTUAL TABLE IF NOT EXISTS volunteers_fts
+    USING fts5(skills, content='volunteers', content_rowid='id');
+    
+    CREATE TRIGGER IF NOT EXISTS volunteers_fts_insert AFTER INSERT ON volunteers BEGIN
+        INSERT INTO volunteers_fts(rowid, skills) VALUES (new.id, new.skills);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS volunteers_fts_delete AFTER DELETE ON volunteers BEGIN
+        INSERT INTO volunteers_fts(volunteers_fts, rowid, skills) VALUES ('delete', old.id, old.skills);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS volunteers_fts_update AFTER UPDATE OF skills ON volunteers BEGIN
+        INSERT INTO volunteers_fts(volunteers_fts, rowid, skills) VALUES ('delete', old.id, old.skills);
+        INSERT INTO volunteers_fts(rowid, skills) VALUES (new.id, new.skills);
+    END;
+    
+    -- Index volunteers registered before the full-text table existed
+    INSERT INTO volunteers_fts(volunteers_fts) VALUES ('rebuild');
+'''
+
+# Case columns supplied on insert; priority_score is appended last when
+# SQLite cannot generate it
+_CASE_COLUMNS = (
+    'title', 'description', 'severity', 'people_affected', 'urgency',
+    'available_resources', 'required_skill', 'status', 'created_at',
+)
+_INSERT_CASE_COLUMNS = _CASE_COLUMNS if GENERATED_PRIORITY else _CASE_COLUMNS + ('priority_score',)
+
+# Shared INSERT statements. Reusing the exact same SQL string lets each
+# connection's statement cache hand back the already-prepared statement.
+_INSERT_CASE_SQL = (
+    f"INSERT INTO cases ({', '.join(_INSERT_CASE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_INSERT_CASE_COLUMNS))})"
+)
+
+_INSERT_VOLUNTEER_SQL = '''
+    INSERT INTO volunteers (name, skills, availability, registered_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+# Cached dashboard statistics: {'stats': (expires_at, stats)}
+_dashboard_cache = {}
+_dashboard_cache_lock = threading.Lock()
+
+
+def _create_connection():
     """
-    Create a connection to the SQLite database.
+    Open a new connection to the SQLite database.
     
     Returns:
         sqlite3.Connection: Database connection object
     """
-    conn = sqlite3.connect(DATABASE_PATH)
+    # Pooled connections are handed between request threads
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row  # Access columns by name
+    
+    # Per-connection tuning (journal_mode=WAL is persisted by init_database)
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')  # 256MB
+    conn.execute('PRAGMA cache_size=-20000')  # ~20MB
+    conn.execute('PRAGMA foreign_keys=ON')
     return conn
 
 
+def _fill_pool():
+    """Open DATABASE_POOL_SIZE connections the first time the pool is used."""
+    global _pool_filled
+    
+    with _pool_lock:
+        if _pool_filled:
+            return
+        for _ in range(DATABASE_POOL_SIZE):
+            _POOL.put(_create_connection())
+        _pool_filled = True
+
+
+@contextmanager
+def db_conn():
+    """
+    Borrow a connection from the pool for the duration of a block.
+    
+    Any transaction left open by the block is rolled back before the
+    connection is returned, so the next borrower starts clean.
+    
+    Yields:
+        sqlite3.Connection: Pooled database connection
+    """
+    if not _pool_filled:
+        _fill_pool()
+    
+    conn = _POOL.get()
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        _POOL.put(conn)
+
+
 def init_database():
     """
     Initialize the database with required tables.
@@ -48,61 +243,82 @@ def init_database():
         - urgency: Urgency level 1-5 (INTEGER)
         - available_resources: Current resource units (INTEGER)
         - required_skill: Required expertise (TEXT)
-        - priority_score: Calculated priority (INTEGER)
+        - priority_score: Calculated priority (INTEGER, generated by SQLite 3.31+)
         - status: Case status - Pending/Active/Completed (TEXT)
-        - created_at: Timestamp (TEXT)
+        - created_at: Epoch nanoseconds, UTC (INTEGER)
     
     volunteers table:
         - id: Primary key (auto-increment)
         - name: Volunteer name (TEXT)
         - skills: Comma-separated skills (TEXT)
         - availability: Available for deployment (INTEGER: 0=No, 1=Yes)
-        - registered_at: Timestamp (TEXT)
+        - registered_at: Epoch nanoseconds, UTC (INTEGER)
+    
+    volunteers_fts table:
+        - FTS5 index over volunteers.skills, maintained by triggers
+    
+    The database is switched to WAL journaling so dashboard reads are not
+    blocked by inserts. WAL is stored in the database file, so every
+    pooled connection picks it up without setting it again.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with db_conn() as conn:
+        cursor = conn.cursor()
+        
+        if not GENERATED_PRIORITY:
+            print(f'SQLite {sqlite3.sqlite_version} has no generated columns; '
+                  'priority_score will be calculated in Python')
+        
+        # Tables created by older versions store priority_score as a plain
+        # column and/or timestamps as ISO text; rebuild them in place
+        cases_columns = _column_info(cursor, 'cases')
+        if cases_columns and (
+            (GENERATED_PRIORITY and cases_columns['priority_score'][1] == 0)
+            or cases_columns['created_at'][0] == 'TEXT'
+        ):
+            print('Rebuilding cases table with the current schema...')
+            _rebuild_table(conn, 'cases', _CREATE_CASES_SQL, ('id',) + _INSERT_CASE_COLUMNS, 'created_at')
+        
+        volunteer_columns = _column_info(cursor, 'volunteers')
+        if volunteer_columns and volunteer_columns['registered_at'][0] == 'TEXT':
+            print('Rebuilding volunteers table with the current schema...')
+            _rebuild_table(conn, 'volunteers', _CREATE_VOLUNTEERS_SQL,
+                           ('id', 'name', 'skills', 'availability', 'registered_at'), 'registered_at')
+        
+        # Create tables and indexes in one batch
+        conn.executescript(_SCHEMA_SQL)
+        conn.commit()
+
+
+def _column_info(cursor, table):
+    """Map each column of an existing table to (declared type, hidden flag)."""
+    # table_xinfo marks generated columns as hidden (2 = virtual, 3 = stored)
+    return {
+        column[1]: (column[2].upper(), column[6])
+        for column in cursor.execute(f'PRAGMA table_xinfo({table})')
+    }
+
+
+def _rebuild_table(conn, table, create_sql, columns, timestamp_column):
+    """
+    Recreate a table from its current DDL and copy its rows across.
     
-    # Create cases table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS cases (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            severity INTEGER NOT NULL CHECK(severity >= 1 AND severity <= 5),
-            people_affected INTEGER NOT NULL CHECK(people_affected >= 0),
-            urgency INTEGER NOT NULL CHECK(urgency >= 1 AND urgency <= 5),
-            available_resources INTEGER NOT NULL CHECK(available_resources >= 0),
-            required_skill TEXT NOT NULL,
-            priority_score INTEGER NOT NULL,
-            status TEXT NOT NULL DEFAULT 'Pending',
-            created_at TEXT NOT NULL
-        )
-    ''')
-    
-    # Create volunteers table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS volunteers (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            skills TEXT NOT NULL,
-            availability INTEGER NOT NULL DEFAULT 1,
-            registered_at TEXT NOT NULL
-        )
-    ''')
-    
-    # Create indexes for better query performance
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_priority_score 
-        ON cases(priority_score DESC)
-    ''')
-    
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_status 
-        ON cases(status)
-    ''')
+    ISO text timestamps in timestamp_column are converted to epoch
+    nanoseconds on the way; integer values are copied unchanged.
+    """
+    column_list = ', '.join(columns)
+    select_list = ', '.join(
+        f"CASE WHEN typeof({c}) = 'text' THEN {_ISO_TO_EPOCH_NS_SQL.format(c)} ELSE {c} END"
+        if c == timestamp_column else c
+        for c in columns
+    )
     
+    cursor = conn.cursor()
+    cursor.execute('BEGIN')
+    cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_old')
+    cursor.execute(create_sql)
+    cursor.execute(f'INSERT INTO {table} ({column_list}) SELECT {select_list} FROM {table}_old')
+    cursor.execute(f'DROP TABLE {table}_old')
     conn.commit()
-    conn.close()
 
 
 def seed_database():
@@ -110,120 +326,77 @@ def seed_database():
     Seed the database with realistic sample data.
     Only runs if the cases table is empty (prevents duplicate inserts).
     
-    Inserts:
+    Inserts (from seed.json, read only when seeding is needed):
         - 25 realistic crisis cases with varied parameters
         - 15 volunteers with diverse skills and availability
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Check if database is already seeded
-    case_count = cursor.execute('SELECT COUNT(*) FROM cases').fetchone()[0]
-    
-    if case_count > 0:
-        print('Database already seeded. Skipping seed data insertion.')
-        conn.close()
-        return
-    
-    print('Seeding database with sample data...')
-    
-    # Seed crisis cases
-    crisis_cases = [
-        # High severity, high urgency cases
-        ('Severe Flooding in District 7', 'Heavy rainfall caused river overflow affecting residential areas. Immediate evacuation needed. Water levels rising rapidly.', 5, 850, 5, 12, 'Emergency Medicine, Rescue Operations', 'Active'),
-        ('Building Collapse - Downtown', 'Multi-story residential building collapsed. Multiple casualties reported. Search and rescue operations underway.', 5, 120, 5, 8, 'Structural Engineering, Emergency Medicine', 'Active'),
-        ('Wildfire Approaching Settlement', 'Forest fire spreading rapidly toward populated area. Evacuation orders issued. Air quality hazardous.', 5, 2400, 5, 15, 'Firefighting, Logistics', 'Active'),
-        ('Mass Food Poisoning Event', 'Contaminated water supply affecting entire neighborhood. Hospital capacity exceeded. Urgent medical intervention required.', 4, 450, 5, 6, 'Emergency Medicine, Public Health', 'Active'),
-        ('Chemical Plant Leak', 'Toxic gas leak from industrial facility. Evacuation zone established. Decontamination protocols activated.', 5, 680, 5, 10, 'Hazmat Response, Emergency Medicine', 'Active'),
+    with db_conn() as conn:
+        cursor = conn.cursor()
         
-        # Medium-high severity cases
-        ('Earthquake Aftershock Zone', 'Multiple aftershocks following major earthquake. Infrastructure damage assessment ongoing. Shelter needs critical.', 4, 1200, 4, 18, 'Structural Engineering, Logistics', 'Active'),
-        ('Refugee Camp Overcrowding', 'Sudden influx of displaced persons. Sanitation facilities inadequate. Disease outbreak risk high.', 4, 3500, 4, 25, 'Public Health, Logistics', 'Pending'),
-        ('Bridge Infrastructure Failure', 'Major bridge showing structural weakness. Traffic rerouted. Inspection and repair urgent to prevent collapse.', 4, 0, 4, 8, 'Structural Engineering, Civil Engineering', 'Active'),
-        ('Hospital Power Outage', 'Main hospital lost power during storm. Backup generators failing. Patient care compromised.', 4, 280, 5, 5, 'Electrical Engineering, Emergency Medicine', 'Completed'),
-        ('Landslide Road Blockage', 'Major highway blocked by landslide. Communities isolated. Supply routes cut off.', 3, 950, 4, 12, 'Civil Engineering, Logistics', 'Active'),
+        # Check if database is already seeded
+        case_count = cursor.execute('SELECT COUNT(*) FROM cases').fetchone()[0]
         
-        # Medium severity cases
-        ('Water Supply Contamination', 'Municipal water system contaminated. Boil water advisory issued. Alternative water sources needed.', 3, 5200, 3, 20, 'Public Health, Water Engineering', 'Pending'),
-        ('School Building Damage', 'Elementary school damaged in storm. 400 students displaced. Temporary facilities needed urgently.', 3, 400, 3, 15, 'Civil Engineering, Education Coordination', 'Completed'),
-        ('Elderly Care Facility Evacuation', 'Nursing home requires evacuation due to structural concerns. 85 residents need relocation and medical support.', 3, 85, 4, 10, 'Emergency Medicine, Logistics', 'Active'),
-        ('Agricultural Pest Outbreak', 'Locust swarm destroying crops. Food security threatened. Immediate intervention required.', 3, 8000, 3, 8, 'Agriculture, Logistics', 'Pending'),
-        ('Telecommunications Outage', 'Cell tower damage affecting emergency communications. Repair crews mobilizing.', 2, 15000, 3, 25, 'Telecommunications, Electrical Engineering', 'Completed'),
+        if case_count > 0:
+            print('Database already seeded. Skipping seed data insertion.')
+            return
         
-        # Lower severity but significant cases
-        ('Community Center Flood Damage', 'Local community center flooded. Serves as emergency shelter. Repairs needed before next storm.', 2, 0, 2, 18, 'Civil Engineering, Construction', 'Pending'),
-        ('Medical Supply Shortage', 'Regional hospital running low on critical medications. Supply chain disruption.', 3, 1200, 3, 12, 'Supply Chain, Medical Logistics', 'Completed'),
-        ('Temporary Housing Setup', 'Need to establish temporary housing for displaced families. Site preparation required.', 2, 320, 2, 22, 'Logistics, Construction', 'Pending'),
-        ('Food Distribution Coordination', 'Organizing food distribution for affected neighborhoods. Volunteers and logistics support needed.', 2, 2800, 2, 35, 'Logistics, Supply Chain', 'Active'),
-        ('Psychological Support Services', 'Trauma counseling needed for disaster survivors. Mental health resources deployment.', 2, 650, 2, 15, 'Mental Health, Social Services', 'Completed'),
+        print('Seeding database with sample data...')
         
-        # Lower priority cases
-        ('Infrastructure Assessment', 'Post-disaster infrastructure survey needed. Non-urgent but important for recovery planning.', 2, 0, 1, 40, 'Civil Engineering, Urban Planning', 'Pending'),
-        ('Community Recovery Planning', 'Long-term recovery strategy development. Stakeholder meetings and resource allocation.', 1, 4500, 1, 45, 'Urban Planning, Community Development', 'Completed'),
-        ('Debris Removal Operations', 'Clearing debris from residential areas. Coordinating heavy equipment and disposal.', 2, 1800, 2, 30, 'Logistics, Heavy Equipment Operation', 'Active'),
-        ('Utility Restoration Coordination', 'Coordinating power and water restoration efforts. Multiple utility companies involved.', 2, 3200, 2, 28, 'Electrical Engineering, Project Management', 'Completed'),
-        ('Volunteer Coordination Hub', 'Establishing central coordination point for volunteer activities. Training and deployment logistics.', 1, 0, 1, 50, 'Project Management, Communications', 'Completed'),
-    ]
-    
-    # Insert crisis cases with calculated priority scores
-    for title, description, severity, people_affected, urgency, resources, skill, status in crisis_cases:
-        priority_score = calculate_priority(severity, people_affected, urgency, resources)
-        created_at = datetime.utcnow().isoformat()
+        # Load the bundled sample cases and volunteers
+        with open(SEED_DATA_PATH, encoding='utf-8') as f:
+            seed_data = json.load(f)
         
-        cursor.execute('''
-            INSERT INTO cases (
-                title, description, severity, people_affected, urgency,
-                available_resources, required_skill, priority_score, status, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (title, description, severity, people_affected, urgency,
-              resources, skill, priority_score, status, created_at))
-    
-    print(f'✓ Inserted {len(crisis_cases)} crisis cases')
-    
-    # Seed volunteers
-    volunteers = [
-        ('Dr. Sarah Chen', 'Emergency Medicine, Trauma Care, Triage', 1),
-        ('Marcus Rodriguez', 'Structural Engineering, Building Assessment, Safety Inspection', 1),
-        ('Emily Thompson', 'Public Health, Epidemiology, Disease Prevention', 1),
-        ('James Wilson', 'Logistics, Supply Chain Management, Distribution', 1),
-        ('Dr. Aisha Patel', 'Emergency Medicine, Pediatrics, Field Surgery', 1),
-        ('David Kim', 'Civil Engineering, Infrastructure, Water Systems', 1),
-        ('Rachel Foster', 'Mental Health, Trauma Counseling, Crisis Intervention', 1),
-        ('Carlos Mendez', 'Firefighting, Rescue Operations, Hazmat Response', 1),
-        ('Dr. Lisa Anderson', 'Public Health, Sanitation, Water Quality', 0),  # Unavailable
-        ('Michael Chang', 'Telecommunications, Network Engineering, Emergency Communications', 1),
-        ('Jennifer Brooks', 'Project Management, Coordination, Resource Allocation', 1),
-        ('Ahmed Hassan', 'Heavy Equipment Operation, Construction, Debris Removal', 1),
-        ('Dr. Rebecca Martinez', 'Emergency Medicine, Disaster Response, Field Operations', 1),
-        ('Thomas O\'Brien', 'Electrical Engineering, Power Systems, Generator Maintenance', 0),  # Unavailable
-        ('Sophia Nguyen', 'Social Services, Community Outreach, Volunteer Coordination', 1),
-    ]
-    
-    # Insert volunteers
-    for name, skills, availability in volunteers:
-        registered_at = datetime.utcnow().isoformat()
+        crisis_cases = seed_data['cases']
+        volunteers = seed_data['volunteers']
         
-        cursor.execute('''
-            INSERT INTO volunteers (name, skills, availability, registered_at)
-            VALUES (?, ?, ?, ?)
-        ''', (name, skills, availability, registered_at))
-    
-    print(f'✓ Inserted {len(volunteers)} volunteers')
+        # Timestamp is captured once for the whole batch
+        now = time.time_ns()
+        
+        # Insert crisis cases
+        case_rows = [
+            (c['title'], c['description'], c['severity'], c['people_affected'], c['urgency'],
+             c['available_resources'], c['required_skill'], c['status'], now)
+            for c in crisis_cases
+        ]
+        
+        if not GENERATED_PRIORITY:
+            # Score every case in one vectorized pass over the numeric columns
+            priority_scores = calculate_priority_batch(
+                [c['severity'] for c in crisis_cases],
+                [c['people_affected'] for c in crisis_cases],
+                [c['urgency'] for c in crisis_cases],
+                [c['available_resources'] for c in crisis_cases],
+            )
+            case_rows = [row + (score,) for row, score in zip(case_rows, priority_scores.tolist())]
+        
+        # Insert volunteers
+        volunteer_rows = [
+            (v['name'], v['skills'], v['availability'], now)
+            for v in volunteers
+        ]
+        
+        # Both batches are written in a single transaction
+        with conn:
+            cursor.executemany(_INSERT_CASE_SQL, case_rows)
+            cursor.executemany(_INSERT_VOLUNTEER_SQL, volunteer_rows)
+        
+        print(f'✓ Inserted {len(crisis_cases)} crisis cases')
+        print(f'✓ Inserted {len(volunteers)} volunteers')
     
-    conn.commit()
-    conn.close()
+    # Tally statuses and availability in one pass each
+    status_counts = Counter(c['status'] for c in crisis_cases)
+    availability_counts = Counter(v['availability'] for v in volunteers)
     
     print('✓ Database seeding completed successfully!')
     print(f'  - Total cases: {len(crisis_cases)}')
-    print(f'  - Active cases: {sum(1 for c in crisis_cases if c[7] == "Active")}')
-    print(f'  - Pending cases: {sum(1 for c in crisis_cases if c[7] == "Pending")}')
-    print(f'  - Completed cases: {sum(1 for c in crisis_cases if c[7] == "Completed")}')
-    print(f'  - Available volunteers: {sum(1 for v in volunteers if v[2] == 1)}')
-    print(f'  - Unavailable volunteers: {sum(1 for v in volunteers if v[2] == 0)}')
+    print(f'  - Active cases: {status_counts["Active"]}')
+    print(f'  - Pending cases: {status_counts["Pending"]}')
+    print(f'  - Completed cases: {status_counts["Completed"]}')
+    print(f'  - Available volunteers: {availability_counts[1]}')
+    print(f'  - Unavailable volunteers: {availability_counts[0]}')
     
     # Calculate and display metrics
-    completed = sum(1 for c in crisis_cases if c[7] == "Completed")
-    resolution_rate = round((completed / len(crisis_cases)) * 100, 1)
+    resolution_rate = round((status_counts['Completed'] / len(crisis_cases)) * 100, 1)
     print(f'  - Resolution rate: {resolution_rate}%')
 
 
@@ -231,6 +404,25 @@ def seed_database():
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _priority_formula(severity, people_affected, urgency, available_resources):
+    """Priority formula shared by the scalar (JIT-compiled) and batch paths."""
+    return (severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)
+
+
+# The Python formula only runs when SQLite cannot generate priority_score.
+# In that case it is compiled with Numba when Numba is installed: the
+# explicit signature compiles eagerly at import, and the compiled object is
+# cached on disk so later processes skip the compile step.
+_calc_priority_jit = _priority_formula
+if not GENERATED_PRIORITY:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+    else:
+        _calc_priority_jit = njit('i8(i8,i8,i8,i8)', cache=True)(_priority_formula)
+
+
 def calculate_priority(severity, people_affected, urgency, available_resources):
     """
     Calculate priority score for a crisis case.
@@ -248,91 +440,226 @@ def calculate_priority(severity, people_affected, urgency, available_resources):
     Returns:
         int: Calculated priority score
     """
-    return (severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)
-
+    return _calc_priority_jit(severity, people_affected, urgency, available_resources)
 
-# ============================================================================
-# ROUTES
-# ============================================================================
 
-@app.route('/')
-def index():
+def calculate_priority_batch(severity, people_affected, urgency, available_resources):
     """
-    Dashboard showing overview statistics.
+    Calculate priority scores for many crisis cases at once.
     
-    Displays:
-        - Total number of cases
-        - Number of high priority cases (priority >= 20)
-        - Number of active volunteers (availability = 1)
-        - Resolution rate (percentage of completed cases)
-        - Volunteer utilization (percentage of volunteers deployed)
+    Applies the priority formula element-wise over whole columns, so bulk
+    loads avoid a Python call per row.
+    
+    Args:
+        severity (array-like): Severity levels (1-5)
+        people_affected (array-like): Numbers of people affected
+        urgency (array-like): Urgency levels (1-5)
+        available_resources (array-like): Available resource units
+    
+    Returns:
+        np.ndarray: Calculated priority scores
+    """
+    # Only seeding on SQLite < 3.31 gets here, so numpy is not loaded at import
+    import numpy as np
+    
+    return _priority_formula(
+        np.asarray(severity, dtype=np.int64),
+        np.asarray(people_affected, dtype=np.int64),
+        np.asarray(urgency, dtype=np.int64),
+        np.asarray(available_resources, dtype=np.int64),
+    )
+
+
+def _dashboard_stats():
     """
-    conn = get_db_connection()
+    Get dashboard statistics, cached for DASHBOARD_CACHE_TTL seconds.
     
-    # Get total cases
-    total_cases = conn.execute('SELECT COUNT(*) FROM cases').fetchone()[0]
+    The cache is also cleared whenever a case or volunteer is added, so
+    the TTL only bounds staleness across worker processes.
     
-    # Get high priority cases (priority_score >= 20)
-    high_priority_cases = conn.execute(
-        'SELECT COUNT(*) FROM cases WHERE priority_score >= 20'
-    ).fetchone()[0]
+    Returns:
+        dict: Template variables for the dashboard
+    """
+    with _dashboard_cache_lock:
+        cached = _dashboard_cache.get('stats')
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+    
+    with db_conn() as conn:
+        # All case counts come from a single scan of idx_status_priority_inputs;
+        # SUM() over a comparison counts the rows where it is true
+        case_stats = conn.execute(f'''
+            SELECT COUNT(*) AS total,
+                   COALESCE(SUM({_PRIORITY_SQL} >= 20), 0) AS high_priority,
+                   COALESCE(SUM(status = 'Active'), 0) AS active,
+                   COALESCE(SUM(status = 'Completed'), 0) AS completed
+            FROM cases
+        ''').fetchone()
+        
+        # Get active volunteers (availability = 1)
+        active_volunteers = conn.execute(
+            'SELECT COUNT(*) FROM volunteers WHERE availability = 1'
+        ).fetchone()[0]
     
-    # Get active volunteers (availability = 1)
-    active_volunteers = conn.execute(
-        'SELECT COUNT(*) FROM volunteers WHERE availability = 1'
-    ).fetchone()[0]
+    total_cases = case_stats['total']
+    high_priority_cases = case_stats['high_priority']
     
     # Calculate resolution rate (completed cases / total cases * 100)
-    completed_cases = conn.execute(
-        "SELECT COUNT(*) FROM cases WHERE status = 'Completed'"
-    ).fetchone()[0]
-    
     resolution_rate = 0
     if total_cases > 0:
-        resolution_rate = round((completed_cases / total_cases) * 100, 1)
+        resolution_rate = round((case_stats['completed'] / total_cases) * 100, 1)
     
     # Calculate volunteer utilization
     # For demo purposes: Active cases / Available volunteers * 100
     # (Assumes each active case needs ~1 volunteer)
-    active_cases = conn.execute(
-        "SELECT COUNT(*) FROM cases WHERE status = 'Active'"
-    ).fetchone()[0]
-    
     volunteer_utilization = 0
     if active_volunteers > 0:
-        volunteer_utilization = round((active_cases / active_volunteers) * 100, 1)
+        volunteer_utilization = round((case_stats['active'] / active_volunteers) * 100, 1)
         # Cap at 100% for display purposes
         if volunteer_utilization > 100:
             volunteer_utilization = 100
     
-    conn.close()
+    stats = {
+        'total_cases': total_cases,
+        'high_priority_cases': high_priority_cases,
+        'active_volunteers': active_volunteers,
+        'resolution_rate': resolution_rate,
+        'volunteer_utilization': volunteer_utilization,
+    }
+    
+    with _dashboard_cache_lock:
+        _dashboard_cache['stats'] = (time.monotonic() + DASHBOARD_CACHE_TTL, stats)
+    
+    return stats
+
+
+def _invalidate_dashboard_stats():
+    """Drop cached dashboard statistics after a write."""
+    with _dashboard_cache_lock:
+        _dashboard_cache.clear()
+
+
+def find_volunteers_by_skill(conn, skills, limit=10):
+    """
+    Find available volunteers whose skills match any of the given skills.
+    
+    Matching uses the volunteers_fts full-text index, so each skill is
+    looked up as a phrase rather than scanned for in Python.
     
-    return render_template('index.html',
-                         total_cases=total_cases,
-                         high_priority_cases=high_priority_cases,
-                         active_volunteers=active_volunteers,
-                         resolution_rate=resolution_rate,
-                         volunteer_utilization=volunteer_utilization)
+    Args:
+        conn (sqlite3.Connection): Database connection
+        skills (str): Comma-separated skills, e.g. a case's required_skill
+        limit (int): Maximum number of volunteers to return
+    
+    Returns:
+        list: Matching volunteer rows, best match first
+    """
+    # Quote each skill as an FTS5 phrase so user text is never parsed as syntax
+    phrases = [
+        '"' + skill.strip().replace('"', '""') + '"'
+        for skill in skills.split(',') if skill.strip()
+    ]
+    if not phrases:
+        return []
+    
+    return conn.execute('''
+        SELECT v.name, v.skills, v.availability, v.registered_at
+        FROM volunteers_fts f
+        JOIN volunteers v ON v.id = f.rowid
+        WHERE volunteers_fts MATCH ? AND v.availability = 1
+        ORDER BY f.rank
+        LIMIT ?
+    ''', (' OR '.join(phrases), limit)).fetchall()
+
+
+# ============================================================================
+# TEMPLATE FILTERS
+# ============================================================================
+
+@app.template_filter('tsformat')
+def tsformat(ts, fmt='%Y-%m-%d %H:%M'):
+    """
+    Format an epoch-nanosecond timestamp (UTC) for display.
+
+    Usage: {{ case['created_at'] | tsformat('%Y-%m-%d') }}
+    """
+    return datetime.fromtimestamp(ts // 1_000_000_000, tz=timezone.utc).strftime(fmt)
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@app.route('/')
+def index():
+    """
+    Dashboard showing overview statistics.
+    
+    Displays:
+        - Total number of cases
+        - Number of high priority cases (priority >= 20)
+        - Number of active volunteers (availability = 1)
+        - Resolution rate (percentage of completed cases)
+        - Volunteer utilization (percentage of volunteers deployed)
+    """
+    return render_template('index.html', **_dashboard_stats())
 
 
 @app.route('/cases')
 def cases():
     """
-    Display all crisis cases sorted by priority (highest first).
+    Display crisis cases sorted by priority (highest first).
     
-    Returns cases with all fields including calculated priority score.
+    Results are paginated with CASES_PER_PAGE cases per page; the page
+    number comes from the ``page`` query-string parameter.
     """
-    conn = get_db_connection()
-    
-    # Get all cases ordered by priority score (descending)
-    cases = conn.execute('''
-        SELECT * FROM cases 
-        ORDER BY priority_score DESC, created_at DESC
-    ''').fetchall()
+    page = min(max(request.args.get('page', 1, type=int), 1), MAX_CASES_PAGE)
+    
+    with db_conn() as conn:
+        # Get one page of cases ordered by priority score (descending).
+        # One extra row is fetched to tell whether a next page exists.
+        # Only the start of each description is read; the full text is
+        # loaded by case_detail().
+        cases = conn.execute('''
+            SELECT id, title, substr(description, 1, ?) AS summary,
+                   severity, people_affected, urgency, available_resources,
+                   required_skill, priority_score, created_at
+            FROM cases
+            ORDER BY priority_score DESC, created_at DESC
+            LIMIT ? OFFSET ?
+        ''', (CASE_SUMMARY_LENGTH, CASES_PER_PAGE + 1, (page - 1) * CASES_PER_PAGE)).fetchall()
+    
+    has_next = len(cases) > CASES_PER_PAGE
+    prev_url = url_for('cases', page=page - 1) if page > 1 else None
+    next_url = url_for('cases', page=page + 1) if has_next else None
+    
+    return render_template('cases.html',
+                         cases=cases[:CASES_PER_PAGE],
+                         prev_url=prev_url,
+                         next_url=next_url)
+
+
+@app.route('/cases/<int:case_id>')
+def case_detail(case_id):
+    """
+    Display a single crisis case with its full description and the
+    available personnel whose skills match it.
     
-    conn.close()
+    Args:
+        case_id (int): Case ID from the URL
+    """
+    with db_conn() as conn:
+        case = conn.execute(
+            'SELECT * FROM cases WHERE id = ?', (case_id,)
+        ).fetchone()
+        
+        if case is None:
+            abort(404)
+        
+        # Available personnel with the expertise this case needs
+        volunteers = find_volunteers_by_skill(conn, case['required_skill'])
     
-    return render_template('cases.html', cases=cases)
+    return render_template('case_detail.html', case=case, volunteers=volunteers)
 
 
 @app.route('/cases/new', methods=['GET', 'POST'])
@@ -353,37 +680,46 @@ def new_case():
         - required_skill: Required expertise
     """
     if request.method == 'POST':
-        # Get form data
-        title = request.form['title']
-        description = request.form['description']
-        severity = int(request.form['severity'])
-        people_affected = int(request.form['people_affected'])
-        urgency = int(request.form['urgency'])
-        available_resources = int(request.form['available_resources'])
-        required_skill = request.form['required_skill']
+        # Get form data; a missing or non-numeric field sends the user back
+        try:
+            title = request.form['title']
+            description = request.form['description']
+            required_skill = request.form['required_skill']
+            severity, people_affected, urgency, available_resources = (
+                int(request.form[field]) for field in _CASE_NUMERIC_FIELDS
+            )
+        except (KeyError, ValueError):
+            flash('Complete every field; severity, urgency, population and resources must be numbers', 'error')
+            return redirect(url_for('new_case'))
         
-        # Calculate priority score
-        priority_score = calculate_priority(
-            severity, people_affected, urgency, available_resources
-        )
+        # Same bounds as the refactored app's validators; they also keep the
+        # values inside the table's CHECK constraints and SQLite's integer range
+        numbers = (severity, people_affected, urgency, available_resources)
+        for field, value in zip(_CASE_NUMERIC_FIELDS, numbers):
+            label, minimum, maximum, below_message, above_message = INT_FIELD_RULES[field]
+            if not minimum <= value <= maximum:
+                flash(f'{label} {below_message if value < minimum else above_message}', 'error')
+                return redirect(url_for('new_case'))
         
         # Get current timestamp
-        created_at = datetime.utcnow().isoformat()
+        created_at = time.time_ns()
+        
+        params = (title, description, severity, people_affected,
+                  urgency, available_resources, required_skill,
+                  'Pending', created_at)
+        
+        # priority_score is generated by SQLite unless it is too old
+        if not GENERATED_PRIORITY:
+            params += (calculate_priority(
+                severity, people_affected, urgency, available_resources
+            ),)
         
         # Insert into database
-        conn = get_db_connection()
-        conn.execute('''
-            INSERT INTO cases (
-                title, description, severity, people_affected, 
-                urgency, available_resources, required_skill, 
-                priority_score, status, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (title, description, severity, people_affected, 
-              urgency, available_resources, required_skill, 
-              priority_score, 'Pending', created_at))
+        with db_conn() as conn:
+            conn.execute(_INSERT_CASE_SQL, params)
+            conn.commit()
         
-        conn.commit()
-        conn.close()
+        _invalidate_dashboard_stats()
         
         flash('Crisis report filed and prioritized', 'success')
         return redirect(url_for('cases'))
@@ -398,15 +734,13 @@ def volunteers():
     
     Shows volunteers ordered by registration date (newest first).
     """
-    conn = get_db_connection()
-    
-    # Get all volunteers ordered by registration date
-    volunteers = conn.execute('''
-        SELECT * FROM volunteers 
-        ORDER BY registered_at DESC
-    ''').fetchall()
-    
-    conn.close()
+    with db_conn() as conn:
+        # Get all volunteers ordered by registration date
+        volunteers = conn.execute('''
+            SELECT name, skills, availability, registered_at
+            FROM volunteers
+            ORDER BY registered_at DESC
+        ''').fetchall()
     
     return render_template('volunteers.html', volunteers=volunteers)
 
@@ -435,17 +769,14 @@ def register_volunteer():
         availability = 1
         
         # Get current timestamp
-        registered_at = datetime.utcnow().isoformat()
+        registered_at = time.time_ns()
         
         # Insert into database
-        conn = get_db_connection()
-        conn.execute('''
-            INSERT INTO volunteers (name, skills, availability, registered_at)
-            VALUES (?, ?, ?, ?)
-        ''', (name, skills, availability, registered_at))
+        with db_conn() as conn:
+            conn.execute(_INSERT_VOLUNTEER_SQL, (name, skills, availability, registered_at))
+            conn.commit()
         
-        conn.commit()
-        conn.close()
+        _invalidate_dashboard_stats()
         
         flash('Personnel registered and ready for deployment', 'success')
         return redirect(url_for('volunteers'))
@@ -454,16 +785,26 @@ def register_volunteer():
 
 
 # ============================================================================
-# APPLICATION INITIALIZATION
+# CLI COMMANDS
 # ============================================================================
 
-if __name__ == '__main__':
-    # Initialize database tables on startup
+@app.cli.command('init-db')
+def init_db_command():
+    """Create tables and indexes (run once before starting workers)."""
     init_database()
     print(f'Database initialized at: {DATABASE_PATH}')
-    
-    # Seed database with sample data (only runs once)
+
+
+@app.cli.command('seed-db')
+def seed_db_command():
+    """Load sample data into an empty database."""
     seed_database()
-    
-    # Run the application
+
+
+# ============================================================================
+# APPLICATION INITIALIZATION
+# ============================================================================
+
+if __name__ == '__main__':
+    # Database is prepared separately: flask --app app init-db && flask --app app seed-db
     app.run(debug=True)
@@ -3,15 +3,16 @@ ImpactBridge - Crisis Coordination Platform
 Refactored with proper architecture, validation, and error handling
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash, abort
 import logging
 from logging.handlers import RotatingFileHandler
 import os
+from datetime import datetime
 
 from models import db, CrisisCase, Volunteer
 from config import get_config
 from validators import CrisisValidator, VolunteerValidator, ValidationError
-from services import CrisisService, VolunteerService
+from services import CrisisService, VolunteerService, cache
 
 
 def create_app(config_name=None):
@@ -32,6 +33,7 @@ def create_app(config_name=None):
     
     # Initialize extensions
     db.init_app(app)
+    cache.init_app(app)
     
     # Setup logging
     setup_logging(app)
@@ -42,10 +44,17 @@ def create_app(config_name=None):
     # Register routes
     register_routes(app)
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-        app.logger.info('Database tables created')
+    # Register CLI commands
+    register_commands(app)
+    
+    # Register template filters
+    register_template_filters(app)
+    
+    # Create database tables (production runs `flask init-db` before starting workers)
+    if app.config.get('AUTO_CREATE_DB'):
+        with app.app_context():
+            db.create_all()
+            app.logger.info('Database tables created')
     
     return app
 
@@ -73,6 +82,26 @@ def setup_logging(app):
         app.logger.info('ImpactBridge startup')
 
 
+def register_commands(app):
+    """Register CLI commands for the application"""
+    
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create database tables"""
+        db.create_all()
+        app.logger.info('Database tables created')
+        print('Database tables created')
+
+
+def register_template_filters(app):
+    """Register Jinja filters used by the shared templates"""
+    
+    @app.template_filter('tsformat')
+    def tsformat(value, fmt='%Y-%m-%d %H:%M'):
+        """Format a model datetime (the templates are shared with app.py)"""
+        return value.strftime(fmt)
+
+
 def register_error_handlers(app):
     """Register error handlers for the application"""
     
@@ -126,15 +155,46 @@ def register_routes(app):
     
     @app.route('/cases')
     def cases():
-        """Display all crisis cases sorted by priority"""
+        """Display crisis cases sorted by priority, one page at a time"""
         try:
-            sorted_cases = CrisisService.get_all_cases_sorted()
-            return render_template('cases.html', cases=sorted_cases)
+            # Keyset cursor: the last case shown on the previous page
+            try:
+                cursor = (
+                    request.args.get('after_priority', type=int),
+                    datetime.fromisoformat(request.args['after_created']),
+                    request.args.get('after_id', type=int)
+                ) if 'after_created' in request.args else (None, None, None)
+            except ValueError:
+                cursor = (None, None, None)
+            
+            page_cases, has_more = CrisisService.get_cases_page(
+                *cursor, limit=app.config['CASES_PER_PAGE']
+            )
+            
+            next_url = None
+            if has_more:
+                last = page_cases[-1]
+                next_url = url_for('cases',
+                                   after_priority=last['priority_score'],
+                                   after_created=last['created_at'].isoformat(),
+                                   after_id=last['id'])
+            
+            return render_template('cases.html', cases=page_cases, next_url=next_url)
         except Exception as e:
             app.logger.error(f'Error loading cases: {e}')
             flash('Error loading crisis cases', 'error')
             return render_template('cases.html', cases=[])
     
+    @app.route('/cases/<int:case_id>')
+    def case_detail(case_id):
+        """Display a single crisis case with matching personnel"""
+        case = CrisisService.get_case_by_id(case_id)
+        if case is None:
+            abort(404)
+        
+        matching_volunteers = VolunteerService.find_by_skills(case.required_skill)
+        return render_template('case_detail.html', case=case, volunteers=matching_volunteers)
+    
     @app.route('/cases/new', methods=['GET', 'POST'])
     def new_case():
         """Create a new crisis case"""
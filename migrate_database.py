@@ -1,15 +1,58 @@
 """
 Database migration script
-Adds priority_score column to existing crisis_case table
+Rebuilds existing tables to match models.py: a generated priority_score
+column and database-side creation timestamps
 """
 
 import sqlite3
 from datetime import datetime
 
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable
 
-def calculate_priority(severity, people_affected, urgency, available_resources):
-    """Calculate priority score"""
-    return (severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)
+from models import CrisisCase, Stat, Volunteer, STATS_DDL, VOLUNTEER_FTS_DDL
+
+
+def _create_table_sql(model, **kw):
+    """Compile a model's CREATE TABLE statement for SQLite"""
+    return str(CreateTable(model.__table__, **kw).compile(dialect=sqlite.dialect()))
+
+
+# Table layouts come straight from models.py; priority_score is computed by
+# SQLite (generated columns need SQLite 3.31+)
+CRISIS_CASE_DDL = _create_table_sql(CrisisCase)
+VOLUNTEER_DDL = _create_table_sql(Volunteer)
+STATS_TABLE_DDL = _create_table_sql(Stat, if_not_exists=True)
+
+# Columns copied when a table is rebuilt (generated columns are recomputed)
+CRISIS_CASE_COLUMNS = tuple(c.name for c in CrisisCase.__table__.columns if c.computed is None)
+VOLUNTEER_COLUMNS = tuple(c.name for c in Volunteer.__table__.columns)
+
+
+def _rebuild_table(conn, table, create_sql, columns):
+    """
+    Recreate a table from new DDL and copy its rows across
+    
+    Indexes and triggers on the old table are dropped with it; the caller
+    recreates them once the rows are in place.
+    
+    Args:
+        conn: Connection with an open transaction
+        table: Table name
+        create_sql: CREATE TABLE statement for the new layout
+        columns: Columns copied from the old table
+        
+    Returns:
+        int: Number of rows copied
+    """
+    column_list = ', '.join(columns)
+    conn.execute(f'ALTER TABLE {table} RENAME TO {table}_old')
+    conn.execute(create_sql)
+    copied = conn.execute(
+        f'INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table}_old'
+    ).rowcount
+    conn.execute(f'DROP TABLE {table}_old')
+    return copied
 
 
 def migrate_database(db_path='impactbridge.db'):
@@ -22,94 +65,140 @@ def migrate_database(db_path='impactbridge.db'):
     print(f'Starting database migration for {db_path}...')
     
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    
+    # Bulk-migration settings. synchronous=OFF skips fsyncs for this
+    # one-off run; back up the database file before migrating.
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-200000')  # ~200MB
     
     try:
-        # Check if priority_score column exists
-        cursor.execute("PRAGMA table_info(crisis_case)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'priority_score' in columns:
-            print('✓ priority_score column already exists')
-        else:
-            print('Adding priority_score column...')
-            cursor.execute('ALTER TABLE crisis_case ADD COLUMN priority_score INTEGER')
-            print('✓ priority_score column added')
-        
-        # Calculate and update priority scores for existing records
-        print('Calculating priority scores for existing records...')
-        cursor.execute('''
-            SELECT id, severity, people_affected, urgency, available_resources
-            FROM crisis_case
-            WHERE priority_score IS NULL
-        ''')
-        
-        records = cursor.fetchall()
-        updated_count = 0
-        
-        for record in records:
-            case_id, severity, people_affected, urgency, available_resources = record
-            priority = calculate_priority(severity, people_affected, urgency, available_resources)
+        # Everything in this block is committed together; an exception
+        # rolls all of it back
+        with conn:
+            conn.execute('BEGIN EXCLUSIVE')
             
-            cursor.execute('''
-                UPDATE crisis_case
-                SET priority_score = ?
-                WHERE id = ?
-            ''', (priority, case_id))
+            # table_xinfo marks generated columns as hidden (2 = virtual, 3 = stored)
+            # and reports each column's DEFAULT expression
+            case_columns = {
+                column[1]: column for column in conn.execute('PRAGMA table_xinfo(crisis_case)')
+            }
             
-            updated_count += 1
-        
-        print(f'✓ Updated {updated_count} records with priority scores')
-        
-        # Create indexes if they don't exist
-        print('Creating indexes...')
-        
-        try:
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_priority_created
-                ON crisis_case(priority_score, created_at)
-            ''')
-            print('✓ Created idx_priority_created')
-        except Exception as e:
-            print(f'  Index idx_priority_created: {e}')
-        
-        try:
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_severity_urgency
-                ON crisis_case(severity, urgency)
-            ''')
-            print('✓ Created idx_severity_urgency')
-        except Exception as e:
-            print(f'  Index idx_severity_urgency: {e}')
-        
-        try:
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_registered_at
-                ON volunteer(registered_at)
-            ''')
-            print('✓ Created idx_registered_at')
-        except Exception as e:
-            print(f'  Index idx_registered_at: {e}')
-        
-        try:
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_availability
-                ON volunteer(availability)
+            priority_column = case_columns.get('priority_score')
+            if priority_column and priority_column[6] == 3 and case_columns['created_at'][4]:
+                print('✓ crisis_case already has a generated priority_score and created_at default')
+            else:
+                if sqlite3.sqlite_version_info < (3, 31, 0):
+                    raise RuntimeError(
+                        f'SQLite {sqlite3.sqlite_version} cannot store generated columns (3.31+ required)'
+                    )
+            
+                # SQLite cannot add a STORED column or change a DEFAULT on an
+                # existing table, so the table is rebuilt. Rows go into a table
+                # with no secondary indexes; those are built afterwards in one
+                # pass each.
+                print('Rebuilding crisis_case with the current schema...')
+                copied_count = _rebuild_table(conn, 'crisis_case', CRISIS_CASE_DDL, CRISIS_CASE_COLUMNS)
+                print(f'✓ Rebuilt crisis_case; priority scores computed for {copied_count} records')
+            
+            volunteer_columns = {
+                column[1]: column for column in conn.execute('PRAGMA table_info(volunteer)')
+            }
+            
+            if volunteer_columns['registered_at'][4]:
+                print('✓ volunteer already has a registered_at default')
+            else:
+                print('Rebuilding volunteer with the current schema...')
+                copied_count = _rebuild_table(conn, 'volunteer', VOLUNTEER_DDL, VOLUNTEER_COLUMNS)
+                print(f'✓ Rebuilt volunteer ({copied_count} records)')
+            
+            # Create indexes if they don't exist
+            print('Creating indexes...')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS ix_crisis_case_priority_score
+                    ON crisis_case(priority_score)
+                ''')
+                print('✓ Created ix_crisis_case_priority_score')
+            except Exception as e:
+                print(f'  Index ix_crisis_case_priority_score: {e}')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_priority_created
+                    ON crisis_case(priority_score, created_at)
+                ''')
+                print('✓ Created idx_priority_created')
+            except Exception as e:
+                print(f'  Index idx_priority_created: {e}')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_severity_urgency
+                    ON crisis_case(severity, urgency)
+                ''')
+                print('✓ Created idx_severity_urgency')
+            except Exception as e:
+                print(f'  Index idx_severity_urgency: {e}')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_high_priority
+                    ON crisis_case(priority_score)
+                    WHERE priority_score >= 20
+                ''')
+                print('✓ Created idx_high_priority')
+            except Exception as e:
+                print(f'  Index idx_high_priority: {e}')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_registered_at
+                    ON volunteer(registered_at)
+                ''')
+                print('✓ Created idx_registered_at')
+            except Exception as e:
+                print(f'  Index idx_registered_at: {e}')
+            
+            try:
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_availability
+                    ON volunteer(availability)
+                ''')
+                print('✓ Created idx_availability')
+            except Exception as e:
+                print(f'  Index idx_availability: {e}')
+            
+            # Full-text index over volunteer skills (models.VOLUNTEER_FTS_DDL)
+            print('Creating volunteer skills full-text index...')
+            for statement in VOLUNTEER_FTS_DDL:
+                conn.execute(statement)
+            # Re-index every existing volunteer (safe to repeat)
+            conn.execute("INSERT INTO volunteer_fts(volunteer_fts) VALUES ('rebuild')")
+            print('✓ Created volunteer_fts')
+            
+            # Dashboard totals maintained by triggers (models.STATS_DDL). The
+            # totals are recounted first so they are correct after every run;
+            # STATS_DDL's own seed only fills in missing rows.
+            print('Creating dashboard stats table...')
+            conn.execute(STATS_TABLE_DDL)
+            conn.execute('''
+                INSERT OR REPLACE INTO stats (key, value) VALUES
+                    ('case_count', (SELECT COUNT(*) FROM crisis_case)),
+                    ('high_priority_count', (SELECT COUNT(*) FROM crisis_case WHERE priority_score >= 20)),
+                    ('volunteer_count', (SELECT COUNT(*) FROM volunteer))
             ''')
-            print('✓ Created idx_availability')
-        except Exception as e:
-            print(f'  Index idx_availability: {e}')
+            for statement in STATS_DDL:
+                conn.execute(statement)
+            print('✓ Created stats')
         
-        # Commit changes
-        conn.commit()
         print('\n✓ Migration completed successfully!')
         
         # Show statistics
-        cursor.execute('SELECT COUNT(*) FROM crisis_case')
-        case_count = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM volunteer')
-        volunteer_count = cursor.fetchone()[0]
+        case_count = conn.execute('SELECT COUNT(*) FROM crisis_case').fetchone()[0]
+        volunteer_count = conn.execute('SELECT COUNT(*) FROM volunteer').fetchone()[0]
         
         print(f'\nDatabase statistics:')
         print(f'  Crisis cases: {case_count}')
@@ -117,7 +206,6 @@ def migrate_database(db_path='impactbridge.db'):
         
     except Exception as e:
         print(f'\n✗ Migration failed: {e}')
-        conn.rollback()
         raise
     finally:
         conn.close()
@@ -2,12 +2,57 @@
 Database models for ImpactBridge
 """
 
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import DDL, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 
 db = SQLAlchemy()
 
 
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database (for server defaults)"""
+    
+    type = db.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _postgresql_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, 'sqlite')
+def _sqlite_utcnow(element, compiler, **kw):
+    # Same text layout SQLAlchemy uses for SQLite DATETIME values, so
+    # defaulted and Python-supplied timestamps compare and sort alike
+    return "(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection once, when the pool opens it"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256MB
+    cursor.execute('PRAGMA cache_size=-64000')  # ~64MB
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
 class CrisisCase(db.Model):
     """Crisis case model with priority scoring"""
     
@@ -15,14 +60,24 @@ class CrisisCase(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    # Deferred: list queries never load the (up to 5000 character) text
+    description = db.deferred(db.Column(db.Text, nullable=False))
     severity = db.Column(db.Integer, nullable=False)
     people_affected = db.Column(db.Integer, nullable=False)
     urgency = db.Column(db.Integer, nullable=False)
     available_resources = db.Column(db.Integer, nullable=False)
     required_skill = db.Column(db.String(100), nullable=False)
-    priority_score = db.Column(db.Integer, nullable=False, index=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    # Computed by the database from the other columns on every insert/update
+    priority_score = db.Column(
+        db.Integer,
+        db.Computed(
+            '(severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)',
+            persisted=True
+        ),
+        nullable=False,
+        index=True
+    )
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
     
     # Database constraints
     __table_args__ = (
@@ -32,6 +87,12 @@ class CrisisCase(db.Model):
         db.CheckConstraint('available_resources >= 0', name='check_resources_positive'),
         db.Index('idx_priority_created', 'priority_score', 'created_at'),
         db.Index('idx_severity_urgency', 'severity', 'urgency'),
+        # Partial index: only high-priority cases, for the dashboard count
+        db.Index(
+            'idx_high_priority', 'priority_score',
+            sqlite_where=db.text('priority_score >= 20'),
+            postgresql_where=db.text('priority_score >= 20')
+        ),
     )
     
     def __repr__(self):
@@ -52,7 +113,6 @@ class CrisisCase(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
-
 class Volunteer(db.Model):
     """Volunteer/Personnel model"""
     
@@ -62,7 +122,7 @@ class Volunteer(db.Model):
     name = db.Column(db.String(100), nullable=False)
     skills = db.Column(db.String(200), nullable=False)
     availability = db.Column(db.String(50), nullable=False)
-    registered_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    registered_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
     
     # Database constraints
     __table_args__ = (
@@ -82,3 +142,93 @@ class Volunteer(db.Model):
             'availability': self.availability,
             'registered_at': self.registered_at.isoformat() if self.registered_at else None
         }
+
+class Stat(db.Model):
+    """Running dashboard totals, kept current by triggers on SQLite"""
+    
+    __tablename__ = 'stats'
+    
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<Stat {self.key}={self.value}>'
+
+
+# Full-text index over volunteer skills (SQLite only), kept in sync by triggers
+VOLUNTEER_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS volunteer_fts
+    USING fts5(skills, content='volunteer', content_rowid='id')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS volunteer_fts_insert AFTER INSERT ON volunteer BEGIN
+        INSERT INTO volunteer_fts(rowid, skills) VALUES (new.id, new.skills);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS volunteer_fts_delete AFTER DELETE ON volunteer BEGIN
+        INSERT INTO volunteer_fts(volunteer_fts, rowid, skills) VALUES ('delete', old.id, old.skills);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS volunteer_fts_update AFTER UPDATE OF skills ON volunteer BEGIN
+        INSERT INTO volunteer_fts(volunteer_fts, rowid, skills) VALUES ('delete', old.id, old.skills);
+        INSERT INTO volunteer_fts(rowid, skills) VALUES (new.id, new.skills);
+    END
+    """,
+)
+
+for _statement in VOLUNTEER_FTS_DDL:
+    event.listen(Volunteer.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
+event.listen(
+    Volunteer.__table__, 'before_drop',
+    DDL('DROP TABLE IF EXISTS volunteer_fts').execute_if(dialect='sqlite')
+)
+
+
+# Dashboard totals (SQLite only). Missing rows are seeded from the current
+# tables; triggers then adjust them on every insert, delete and rescoring
+# update, so the dashboard never has to count rows.
+STATS_DDL = (
+    """
+    INSERT OR IGNORE INTO stats (key, value) VALUES
+        ('case_count', (SELECT COUNT(*) FROM crisis_case)),
+        ('high_priority_count', (SELECT COUNT(*) FROM crisis_case WHERE priority_score >= 20)),
+        ('volunteer_count', (SELECT COUNT(*) FROM volunteer))
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_case_insert AFTER INSERT ON crisis_case BEGIN
+        UPDATE stats SET value = value + 1 WHERE key = 'case_count';
+        UPDATE stats SET value = value + (new.priority_score >= 20) WHERE key = 'high_priority_count';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_case_delete AFTER DELETE ON crisis_case BEGIN
+        UPDATE stats SET value = value - 1 WHERE key = 'case_count';
+        UPDATE stats SET value = value - (old.priority_score >= 20) WHERE key = 'high_priority_count';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_case_update
+    AFTER UPDATE OF severity, people_affected, urgency, available_resources ON crisis_case BEGIN
+        UPDATE stats SET value = value + (new.priority_score >= 20) - (old.priority_score >= 20)
+        WHERE key = 'high_priority_count';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_volunteer_insert AFTER INSERT ON volunteer BEGIN
+        UPDATE stats SET value = value + 1 WHERE key = 'volunteer_count';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_volunteer_delete AFTER DELETE ON volunteer BEGIN
+        UPDATE stats SET value = value - 1 WHERE key = 'volunteer_count';
+    END
+    """,
+)
+
+# Runs after create_all() has created every table the triggers touch
+for _statement in STATS_DDL:
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
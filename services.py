@@ -3,30 +3,56 @@ Business logic layer for ImpactBridge
 Separates business logic from routes and database operations
 """
 
-from models import CrisisCase, Volunteer, db
+import threading
+import time
+
+from flask_caching import Cache
+from sqlalchemy import func, or_, select, text, tuple_
+from sqlalchemy.orm import undefer
+
+from models import CrisisCase, Stat, Volunteer, db
+
+
+# Read-through cache for single-record lookups; bound to the app by
+# create_app(). Cached records are detached snapshots, safe to read only.
+cache = Cache()
+
+
+# Characters of the description shown on the case list
+CASE_SUMMARY_LENGTH = 200
+
+# Columns read by the case and volunteer list views. Lists are fetched as
+# Core row mappings, skipping ORM object construction and change tracking;
+# cases carry a truncated summary instead of the full description.
+CASE_LIST_COLUMNS = (
+    CrisisCase.id, CrisisCase.title,
+    func.substr(CrisisCase.description, 1, CASE_SUMMARY_LENGTH).label('summary'),
+    CrisisCase.severity, CrisisCase.people_affected, CrisisCase.urgency,
+    CrisisCase.available_resources, CrisisCase.required_skill,
+    CrisisCase.priority_score, CrisisCase.created_at,
+)
+VOLUNTEER_LIST_COLUMNS = (
+    Volunteer.id, Volunteer.name, Volunteer.skills, Volunteer.availability,
+    Volunteer.registered_at,
+)
+
+# Seconds a computed dashboard snapshot is served before it is recomputed
+DASHBOARD_CACHE_TTL = 5
+
+# Cached dashboard statistics: {'stats': (expires_at, stats)}
+_dashboard_cache = {}
+_dashboard_cache_lock = threading.Lock()
+
+
+def invalidate_dashboard_stats():
+    """Drop cached dashboard statistics after a write"""
+    with _dashboard_cache_lock:
+        _dashboard_cache.clear()
 
 
 class CrisisService:
     """Service for crisis case operations"""
     
-    @staticmethod
-    def calculate_priority(severity, people_affected, urgency, available_resources):
-        """
-        Calculate priority score for a crisis
-        
-        Formula: (severity × 3) + (people × 2) + (urgency × 4) - (resources × 2)
-        
-        Args:
-            severity: Severity level (1-5)
-            people_affected: Number of people affected
-            urgency: Urgency level (1-5)
-            available_resources: Available resource units
-            
-        Returns:
-            int: Priority score
-        """
-        return (severity * 3) + (people_affected * 2) + (urgency * 4) - (available_resources * 2)
-    
     @staticmethod
     def create_crisis(validated_data):
         """
@@ -41,15 +67,7 @@ class CrisisService:
         Raises:
             Exception: If database operation fails
         """
-        # Calculate priority score
-        priority_score = CrisisService.calculate_priority(
-            validated_data['severity'],
-            validated_data['people_affected'],
-            validated_data['urgency'],
-            validated_data['available_resources']
-        )
-        
-        # Create crisis case
+        # Create crisis case (priority_score is computed by the database)
         case = CrisisCase(
             title=validated_data['title'],
             description=validated_data['description'],
@@ -57,37 +75,78 @@ class CrisisService:
             people_affected=validated_data['people_affected'],
             urgency=validated_data['urgency'],
             available_resources=validated_data['available_resources'],
-            required_skill=validated_data['required_skill'],
-            priority_score=priority_score
+            required_skill=validated_data['required_skill']
         )
         
         db.session.add(case)
         db.session.commit()
+        invalidate_dashboard_stats()
+        cache.delete_memoized(CrisisService.get_case_by_id, case.id)
         
         return case
     
+    @staticmethod
+    def create_crises_bulk(validated_rows):
+        """
+        Create many crisis cases in a single transaction
+        
+        Args:
+            validated_rows: List of dictionaries of validated crisis data
+            
+        Returns:
+            int: Number of crisis cases created
+            
+        Raises:
+            Exception: If database operation fails
+        """
+        # priority_score is computed by the database for every row
+        db.session.bulk_insert_mappings(CrisisCase, validated_rows)
+        db.session.commit()
+        invalidate_dashboard_stats()
+        
+        return len(validated_rows)
+    
     @staticmethod
     def get_dashboard_stats():
         """
-        Get dashboard statistics
+        Get dashboard statistics, cached for DASHBOARD_CACHE_TTL seconds
         
         Returns:
             dict: Dashboard statistics
         """
-        total_cases = CrisisCase.query.count()
+        with _dashboard_cache_lock:
+            cached = _dashboard_cache.get('stats')
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
         
-        # Efficient query for high priority cases
-        high_priority_cases = CrisisCase.query.filter(
-            CrisisCase.priority_score >= 20
-        ).count()
-        
-        active_volunteers = Volunteer.query.count()
+        if db.engine.dialect.name == 'sqlite':
+            # Running totals maintained by the stats triggers
+            totals = dict(db.session.execute(select(Stat.key, Stat.value)).all())
+            total_cases = totals['case_count']
+            high_priority_cases = totals['high_priority_count']
+            active_volunteers = totals['volunteer_count']
+        else:
+            # Both case counts in one round trip; the high-priority count only
+            # reads the small partial index idx_high_priority
+            total_cases, high_priority_cases = db.session.execute(text(
+                'SELECT (SELECT COUNT(*) FROM crisis_case), '
+                '(SELECT COUNT(*) FROM crisis_case WHERE priority_score >= 20)'
+            )).one()
+            
+            active_volunteers = db.session.execute(text(
+                'SELECT COUNT(*) FROM volunteer'
+            )).scalar()
         
-        return {
+        stats = {
             'total_cases': total_cases,
             'high_priority_cases': high_priority_cases,
             'active_volunteers': active_volunteers
         }
+        
+        with _dashboard_cache_lock:
+            _dashboard_cache['stats'] = (time.monotonic() + DASHBOARD_CACHE_TTL, stats)
+        
+        return stats
     
     @staticmethod
     def get_all_cases_sorted():
@@ -95,17 +154,54 @@ class CrisisService:
         Get all crisis cases sorted by priority
         
         Returns:
-            list: List of CrisisCase objects sorted by priority (descending)
+            list: Case row mappings sorted by priority (descending)
         """
-        return CrisisCase.query.order_by(
+        stmt = select(*CASE_LIST_COLUMNS).order_by(
             CrisisCase.priority_score.desc(),
             CrisisCase.created_at.desc()
-        ).all()
+        )
+        return db.session.execute(stmt).mappings().all()
     
     @staticmethod
+    def get_cases_page(cursor_priority=None, cursor_created=None, cursor_id=None, limit=50):
+        """
+        Get one page of crisis cases sorted by priority (keyset pagination)
+        
+        The cursor is the priority_score, created_at and id of the last case
+        on the previous page; leave it unset for the first page. Seeking past
+        the cursor walks idx_priority_created, so every page costs the same
+        regardless of how deep it is.
+        
+        Args:
+            cursor_priority: priority_score of the last case already shown
+            cursor_created: created_at of the last case already shown
+            cursor_id: id of the last case already shown
+            limit: Maximum number of cases to return
+            
+        Returns:
+            tuple: (list of case row mappings, True if more cases follow)
+        """
+        stmt = select(*CASE_LIST_COLUMNS).order_by(
+            CrisisCase.priority_score.desc(),
+            CrisisCase.created_at.desc(),
+            CrisisCase.id.desc()
+        )
+        
+        if cursor_priority is not None:
+            stmt = stmt.where(
+                tuple_(CrisisCase.priority_score, CrisisCase.created_at, CrisisCase.id)
+                < (cursor_priority, cursor_created, cursor_id)
+            )
+        
+        # One extra row tells us whether another page exists
+        cases = db.session.execute(stmt.limit(limit + 1)).mappings().all()
+        return cases[:limit], len(cases) > limit
+    
+    @staticmethod
+    @cache.memoize()
     def get_case_by_id(case_id):
         """
-        Get a crisis case by ID
+        Get a crisis case by ID, cached for CACHE_DEFAULT_TIMEOUT seconds
         
         Args:
             case_id: Crisis case ID
@@ -113,7 +209,8 @@ class CrisisService:
         Returns:
             CrisisCase or None
         """
-        return CrisisCase.query.get(case_id)
+        # Detail views need the description, so load it with the row
+        return db.session.get(CrisisCase, case_id, options=[undefer(CrisisCase.description)])
 
 
 class VolunteerService:
@@ -141,25 +238,49 @@ class VolunteerService:
         
         db.session.add(volunteer)
         db.session.commit()
+        invalidate_dashboard_stats()
+        cache.delete_memoized(VolunteerService.get_volunteer_by_id, volunteer.id)
         
         return volunteer
     
+    @staticmethod
+    def register_volunteers_bulk(validated_rows):
+        """
+        Register many volunteers in a single transaction
+        
+        Args:
+            validated_rows: List of dictionaries of validated volunteer data
+            
+        Returns:
+            int: Number of volunteers registered
+            
+        Raises:
+            Exception: If database operation fails
+        """
+        db.session.bulk_insert_mappings(Volunteer, validated_rows)
+        db.session.commit()
+        invalidate_dashboard_stats()
+        
+        return len(validated_rows)
+    
     @staticmethod
     def get_all_volunteers():
         """
         Get all volunteers sorted by registration date
         
         Returns:
-            list: List of Volunteer objects
+            list: Volunteer row mappings
         """
-        return Volunteer.query.order_by(
+        stmt = select(*VOLUNTEER_LIST_COLUMNS).order_by(
             Volunteer.registered_at.desc()
-        ).all()
+        )
+        return db.session.execute(stmt).mappings().all()
     
     @staticmethod
+    @cache.memoize()
     def get_volunteer_by_id(volunteer_id):
         """
-        Get a volunteer by ID
+        Get a volunteer by ID, cached for CACHE_DEFAULT_TIMEOUT seconds
         
         Args:
             volunteer_id: Volunteer ID
@@ -174,12 +295,67 @@ class VolunteerService:
         """
         Search volunteers by skill
         
+        On SQLite the volunteer_fts index is used, matching skill as a
+        case-insensitive word prefix; other databases fall back to ILIKE.
+        
         Args:
             skill: Skill to search for
             
         Returns:
-            list: List of matching volunteers
+            list: List of matching volunteers, best match first on SQLite
+        """
+        if db.engine.dialect.name != 'sqlite':
+            return Volunteer.query.filter(
+                Volunteer.skills.ilike(f'%{skill}%')
+            ).all()
+        
+        skill = skill.strip()
+        if not skill:
+            return []
+        
+        # Quote the input as an FTS5 phrase so it is never parsed as query syntax
+        query = '"' + skill.replace('"', '""') + '"*'
+        
+        return Volunteer.query.from_statement(text(
+            'SELECT v.* FROM volunteer v '
+            'JOIN volunteer_fts f ON f.rowid = v.id '
+            'WHERE volunteer_fts MATCH :q '
+            'ORDER BY f.rank'
+        )).params(q=query).all()
+    
+    @staticmethod
+    def find_by_skills(skills, limit=10):
+        """
+        Find volunteers matching any of a comma-separated list of skills
+        
+        Each skill is matched as a whole phrase, so a case requiring
+        "Emergency Medicine, Logistics" finds volunteers with either one.
+        
+        Args:
+            skills: Comma-separated skills, e.g. a case's required_skill
+            limit: Maximum number of volunteers to return
+            
+        Returns:
+            list: Volunteer row mappings, best match first on SQLite
         """
-        return Volunteer.query.filter(
-            Volunteer.skills.ilike(f'%{skill}%')
-        ).all()
+        skill_list = [skill.strip() for skill in skills.split(',') if skill.strip()]
+        if not skill_list:
+            return []
+        
+        if db.engine.dialect.name != 'sqlite':
+            stmt = select(*VOLUNTEER_LIST_COLUMNS).where(
+                or_(*(Volunteer.skills.ilike(f'%{skill}%') for skill in skill_list))
+            ).limit(limit)
+            return db.session.execute(stmt).mappings().all()
+        
+        # Quote each skill as an FTS5 phrase so it is never parsed as query syntax
+        query = ' OR '.join('"' + skill.replace('"', '""') + '"' for skill in skill_list)
+        
+        return db.session.execute(text(
+            'SELECT v.id, v.name, v.skills, v.availability, v.registered_at '
+            'FROM volunteer v '
+            'JOIN volunteer_fts f ON f.rowid = v.id '
+            'WHERE volunteer_fts MATCH :q '
+            'ORDER BY f.rank '
+            'LIMIT :limit'
+        ).columns(*VOLUNTEER_LIST_COLUMNS), {'q': query, 'limit': limit}).mappings().all()
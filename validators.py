@@ -8,6 +8,110 @@ class ValidationError(Exception):
     pass
 
 
+# Text field rules: form field -> (label, min length, max length)
+TEXT_FIELD_RULES = {
+    'title': ('Situation title', 5, 200),
+    'description': ('Situation assessment', 20, 5000),
+    'required_skill': ('Critical expertise', 3, 100),
+    'name': ('Full name', 2, 100),
+    'skills': ('Professional expertise', 3, 200),
+}
+
+# Error messages are built once here rather than formatted per request:
+# field -> (min length, max length, required, too short, too long)
+_TEXT_FIELD_CHECKS = {
+    field: (
+        min_length,
+        max_length,
+        f'{label} is required',
+        f'{label} must be at least {min_length} characters',
+        f'{label} must not exceed {max_length} characters',
+    )
+    for field, (label, min_length, max_length) in TEXT_FIELD_RULES.items()
+}
+
+
+def _validate_text(data, field, errors):
+    """
+    Strip a text field and check it against TEXT_FIELD_RULES
+    
+    Args:
+        data: Dictionary of form data
+        field: Form field name
+        errors: List that error messages are appended to
+        
+    Returns:
+        str: Stripped value
+    """
+    min_length, max_length, required, too_short, too_long = _TEXT_FIELD_CHECKS[field]
+    value = data.get(field, '').strip()
+    length = len(value)
+    if not length:
+        errors.append(required)
+    elif length < min_length:
+        errors.append(too_short)
+    elif length > max_length:
+        errors.append(too_long)
+    return value
+
+
+# Integer field rules: form field -> (label, min, max, below-min message,
+# above-max message)
+INT_FIELD_RULES = {
+    'severity': ('Severity', 1, 5, 'must be between 1 and 5', 'must be between 1 and 5'),
+    'urgency': ('Urgency', 1, 5, 'must be between 1 and 5', 'must be between 1 and 5'),
+    'people_affected': ('Population impact', 0, 10000000,  # 10 million cap
+                        'cannot be negative', 'exceeds maximum value'),
+    'available_resources': ('Current resources', 0, 1000000,  # 1 million cap
+                            'cannot be negative', 'exceeds maximum value'),
+}
+
+# field -> (min, max, not a number, below min, above max)
+_INT_FIELD_CHECKS = {
+    field: (
+        minimum,
+        maximum,
+        f'{label} must be a valid number',
+        f'{label} {below_message}',
+        f'{label} {above_message}',
+    )
+    for field, (label, minimum, maximum, below_message, above_message) in INT_FIELD_RULES.items()
+}
+
+
+def _validate_int(data, field, errors):
+    """
+    Coerce an integer field and check it against INT_FIELD_RULES
+    
+    Args:
+        data: Dictionary of form data
+        field: Form field name
+        errors: List that error messages are appended to
+        
+    Returns:
+        int or None: Parsed value, or None if it is not a number
+    """
+    minimum, maximum, not_a_number, below, above = _INT_FIELD_CHECKS[field]
+    value = data.get(field, 0)
+    
+    # Plain digit strings (what the forms submit) convert without the cost
+    # of raising; anything else goes through int() and its error handling
+    if isinstance(value, str) and value.isdecimal():
+        number = int(value)
+    else:
+        try:
+            number = int(value)
+        except (ValueError, TypeError):
+            errors.append(not_a_number)
+            return None
+    
+    if number < minimum:
+        errors.append(below)
+    elif number > maximum:
+        errors.append(above)
+    return number
+
+
 class CrisisValidator:
     """Validates crisis case data"""
     
@@ -27,72 +131,18 @@ class CrisisValidator:
         """
         errors = []
         
-        # Title validation
-        title = data.get('title', '').strip()
-        if not title:
-            errors.append('Situation title is required')
-        elif len(title) < 5:
-            errors.append('Situation title must be at least 5 characters')
-        elif len(title) > 200:
-            errors.append('Situation title must not exceed 200 characters')
-        
-        # Description validation
-        description = data.get('description', '').strip()
-        if not description:
-            errors.append('Situation assessment is required')
-        elif len(description) < 20:
-            errors.append('Situation assessment must be at least 20 characters')
-        elif len(description) > 5000:
-            errors.append('Situation assessment must not exceed 5000 characters')
-        
-        # Severity validation
-        try:
-            severity = int(data.get('severity', 0))
-            if not 1 <= severity <= 5:
-                errors.append('Severity must be between 1 and 5')
-        except (ValueError, TypeError):
-            errors.append('Severity must be a valid number')
-            severity = None
-        
-        # Urgency validation
-        try:
-            urgency = int(data.get('urgency', 0))
-            if not 1 <= urgency <= 5:
-                errors.append('Urgency must be between 1 and 5')
-        except (ValueError, TypeError):
-            errors.append('Urgency must be a valid number')
-            urgency = None
-        
-        # People affected validation
-        try:
-            people_affected = int(data.get('people_affected', 0))
-            if people_affected < 0:
-                errors.append('Population impact cannot be negative')
-            elif people_affected > 10000000:  # 10 million cap
-                errors.append('Population impact exceeds maximum value')
-        except (ValueError, TypeError):
-            errors.append('Population impact must be a valid number')
-            people_affected = None
+        # Title and description validation
+        title = _validate_text(data, 'title', errors)
+        description = _validate_text(data, 'description', errors)
         
-        # Available resources validation
-        try:
-            available_resources = int(data.get('available_resources', 0))
-            if available_resources < 0:
-                errors.append('Current resources cannot be negative')
-            elif available_resources > 1000000:  # 1 million cap
-                errors.append('Current resources exceeds maximum value')
-        except (ValueError, TypeError):
-            errors.append('Current resources must be a valid number')
-            available_resources = None
+        # Severity, urgency, population and resource validation
+        severity = _validate_int(data, 'severity', errors)
+        urgency = _validate_int(data, 'urgency', errors)
+        people_affected = _validate_int(data, 'people_affected', errors)
+        available_resources = _validate_int(data, 'available_resources', errors)
         
         # Required skill validation
-        required_skill = data.get('required_skill', '').strip()
-        if not required_skill:
-            errors.append('Critical expertise is required')
-        elif len(required_skill) < 3:
-            errors.append('Critical expertise must be at least 3 characters')
-        elif len(required_skill) > 100:
-            errors.append('Critical expertise must not exceed 100 characters')
+        required_skill = _validate_text(data, 'required_skill', errors)
         
         # If there are errors, raise exception
         if errors:
@@ -113,7 +163,12 @@ class CrisisValidator:
 class VolunteerValidator:
     """Validates volunteer data"""
     
-    VALID_AVAILABILITY = ['Full-time', 'Part-time', 'Weekends', 'On-call']
+    # Options in display order; the frozenset is used for membership tests
+    AVAILABILITY_OPTIONS = ('Full-time', 'Part-time', 'Weekends', 'On-call')
+    VALID_AVAILABILITY = frozenset(AVAILABILITY_OPTIONS)
+    INVALID_AVAILABILITY_MESSAGE = (
+        f'Deployment capacity must be one of: {", ".join(AVAILABILITY_OPTIONS)}'
+    )
     
     @staticmethod
     def validate_register(data):
@@ -131,30 +186,16 @@ class VolunteerValidator:
         """
         errors = []
         
-        # Name validation
-        name = data.get('name', '').strip()
-        if not name:
-            errors.append('Full name is required')
-        elif len(name) < 2:
-            errors.append('Full name must be at least 2 characters')
-        elif len(name) > 100:
-            errors.append('Full name must not exceed 100 characters')
-        
-        # Skills validation
-        skills = data.get('skills', '').strip()
-        if not skills:
-            errors.append('Professional expertise is required')
-        elif len(skills) < 3:
-            errors.append('Professional expertise must be at least 3 characters')
-        elif len(skills) > 200:
-            errors.append('Professional expertise must not exceed 200 characters')
+        # Name and skills validation
+        name = _validate_text(data, 'name', errors)
+        skills = _validate_text(data, 'skills', errors)
         
         # Availability validation
         availability = data.get('availability', '').strip()
         if not availability:
             errors.append('Deployment capacity is required')
         elif availability not in VolunteerValidator.VALID_AVAILABILITY:
-            errors.append(f'Deployment capacity must be one of: {", ".join(VolunteerValidator.VALID_AVAILABILITY)}')
+            errors.append(VolunteerValidator.INVALID_AVAILABILITY_MESSAGE)
         
         # If there are errors, raise exception
         if errors: